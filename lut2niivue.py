@@ -4,7 +4,7 @@
 # https://matplotlib.org/stable/gallery/color/colormap_reference.html
 # PiYG color map
 
-import codecs, json, os
+import os
 from _cm import datad
 
 for name, spec in datad.items():
@@ -17,14 +17,20 @@ for name, spec in datad.items():
         print('Skipping ' + name)
         continue
     print(' Converting {} with {} nodes'.format(name, nNode))
-    js = {'R': [], 'G': [], 'B': [], 'A': [], 'I': []}
-    for i in range(nNode):
-        js['R'].append(int(255 * pylut[i][0]))
-        js['G'].append(int(255 * pylut[i][1]))
-        js['B'].append(int(255 * pylut[i][2]))
-        idx = int(i/(nNode-1) * 255)
-        js['A'].append(int(0.3 * idx))
-        js['I'].append(idx)
+    idx = [i * 255 // (nNode - 1) for i in range(nNode)]
+    js = {'R': [int(255 * node[0]) for node in pylut],
+          'G': [int(255 * node[1]) for node in pylut],
+          'B': [int(255 * node[2]) for node in pylut],
+          'A': [v * 3 // 10 for v in idx],
+          'I': idx}
     fnm = '.' + os.path.sep + 'lut' + os.path.sep + name + '.json'
-    with codecs.open(fnm, 'w', 'utf8') as f:
-         f.write(json.dumps(js, sort_keys = False, ensure_ascii=False))
+    # fixed schema of integer lists: no escaping or type dispatch needed
+    body = '{"R": [%s], "G": [%s], "B": [%s], "A": [%s], "I": [%s]}' % tuple(
+        ', '.join(map(str, js[key])) for key in 'RGBAI')
+    # leave unchanged files alone so their mtimes are preserved
+    if os.path.exists(fnm):
+        with open(fnm, 'rb') as f:
+            if f.read() == body.encode('utf-8'):
+                continue
+    with open(fnm, 'w', encoding='utf-8') as f:
+        f.write(body)